@@ -22,6 +22,11 @@ if typing.TYPE_CHECKING:
     from digitalhub.entities.function._base.entity import Function
     from digitalhub.entities.run._base.entity import Run
 
+# Output artifacts directory
+KFP_ARTIFACTS_DIR = "/tmp"
+_BASE = os.path.abspath(KFP_ARTIFACTS_DIR)
+_BASE_PREFIX = _BASE + os.sep
+
 
 def _write_output(key: str, value: str) -> None:
     """
@@ -39,23 +44,24 @@ def _write_output(key: str, value: str) -> None:
     Prevents path traversal attacks by validating the output path.
     Logs warnings if writing fails or if the path is unsafe.
     """
-    base = "/tmp"
-    path = os.path.join(base, key)
+    path = os.path.abspath(os.path.join(_BASE, key))
 
     # Check if the path is safe
-    if not base == os.path.commonpath((base, os.path.abspath(path))):
-        LOGGER.info(f"Path traversal is not allowed, ignoring: {path} / {key}")
+    if not (path == _BASE or path.startswith(_BASE_PREFIX)):
+        LOGGER.info("Path traversal is not allowed, ignoring: %s / %s", path, key)
         return
 
     # Write the file
-    path = os.path.abspath(path)
-    LOGGER.info(f"Writing artifact output: {path}, value: {value}")
     try:
-        with open(path, "w") as fp:
-            fp.write(value)
-        LOGGER.info(f"File written: {path}, size: {os.stat(path).st_size}")
+        data = value.encode("utf-8")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        LOGGER.debug("File written: %s, value: %s, size: %d", path, value, len(data))
     except Exception as e:
-        LOGGER.info(f"Failed to write output file {path}: {repr(e)}")
+        LOGGER.info("Failed to write output file %s: %r", path, e)
 
 
 def _export_outputs(run: Run) -> None:
@@ -70,7 +76,7 @@ def _export_outputs(run: Run) -> None:
     try:
         _write_output("run_id", run.id)
     except Exception as e:
-        LOGGER.info(f"Failed writing run_id to temp file. Ignoring ({repr(e)})")
+        LOGGER.info("Failed writing run_id to temp file. Ignoring (%r)", e)
 
     if not hasattr(run, "outputs"):
         return
@@ -87,7 +93,7 @@ def _export_outputs(run: Run) -> None:
         elif isinstance(val, dict) and "key" in val:
             results[target_output] = val["key"]
         else:
-            LOGGER.info(f"Unknown output type for {prop}: {type(val)}")
+            LOGGER.info("Unknown output type for %s: %s", prop, type(val))
             continue
 
     for key, value in results.items():
@@ -116,7 +122,85 @@ def _parse_exec_entity(entity_key: str) -> Function:
         exit(1)
 
 
-def _wait_for_run(run: Run) -> None:
+def _check_step_requirements(exec_kwargs: dict) -> None:
+    """
+    Check step requirements before any backend call.
+    Exits if the action argument or the run environment variables are missing.
+
+    Parameters
+    ----------
+    exec_kwargs : dict
+        The keyword arguments to pass to the entity's run method.
+    """
+    if exec_kwargs.get("action") is None:
+        LOGGER.info("Step failed: action argument is required.")
+        exit(1)
+
+    if not os.getenv(RuntimeEnvVar.RUN_ID.value) or not os.getenv(RuntimeEnvVar.PROJECT.value):
+        LOGGER.info(
+            "Step failed: %s and %s env vars are required.",
+            RuntimeEnvVar.RUN_ID.value,
+            RuntimeEnvVar.PROJECT.value,
+        )
+        exit(1)
+
+
+def _is_finished(state: str) -> bool:
+    """
+    Check if a run state is terminal.
+    Mirrors the terminal states checked by the SDK Run.wait().
+
+    Parameters
+    ----------
+    state : str
+        The run state.
+
+    Returns
+    -------
+    bool
+        True if the run is in a terminal state.
+    """
+    return state in (
+        State.COMPLETED.value,
+        State.ERROR.value,
+        State.STOPPED.value,
+    )
+
+
+def _poll_run(run: Run) -> Run:
+    """
+    Poll a run until it reaches a terminal state.
+
+    The polling interval starts small and doubles up to a cap,
+    and is reset whenever the run changes state.
+
+    Parameters
+    ----------
+    run : Run
+        The run to poll.
+
+    Returns
+    -------
+    Run
+        The refreshed run.
+    """
+    min_delay = 0.25
+    max_delay = 5.0
+
+    delay = min_delay
+    prev_state = run.status.state
+    while not _is_finished(run.status.state):
+        time.sleep(delay)
+        run = run.refresh()
+        if run.status.state != prev_state:
+            prev_state = run.status.state
+            delay = min_delay
+        else:
+            delay = min(delay * 2, max_delay)
+    return run
+
+
+def _wait_for_run(run: Run) -> Run:
     """
     Wait for a run to complete with retry logic.
 
@@ -129,6 +213,11 @@ def _wait_for_run(run: Run) -> None:
     ----------
     run : Run
         The run to wait for.
+
+    Returns
+    -------
+    Run
+        The run in its terminal state.
     """
     max_attempts = 3
     wait_delays = [0, 60, 120]
@@ -144,8 +233,7 @@ def _wait_for_run(run: Run) -> None:
         # Attempt to wait for the run
         try:
             LOGGER.info("Waiting for run to complete")
-            run.wait()
-            break
+            return _poll_run(run)
 
         # If an exception occurs, log it and retry if attempts remain
         except Exception as e:
@@ -174,6 +262,9 @@ def execute_step(
     # Run
     LOGGER.info(f"Executing {func.ENTITY_TYPE} {func.name}:{func.id}")
 
+    # Get action, validated by _check_step_requirements
+    action = exec_kwargs.pop("action")
+
     # Get workflow run id from run env var
     workflow_run_id = os.getenv(RuntimeEnvVar.RUN_ID.value)
     project = os.getenv(RuntimeEnvVar.PROJECT.value)
@@ -181,11 +272,6 @@ def execute_step(
     workflow_run_key = workflow_run.key + ":" + workflow_run.id
 
     # Get task and run kind
-    action = exec_kwargs.pop("action", None)
-    if action is None:
-        LOGGER.info("Step failed: action argument is required.")
-        exit(1)
-
     task_kind = entity_factory.get_task_kind_from_action(func.kind, action)
     run_kind = entity_factory.get_run_kind_from_action(func.kind, action)
 
@@ -199,13 +285,14 @@ def execute_step(
     # Create run from task
     run = task.run(run_kind, save=False, local_execution=False, **exec_kwargs)
 
-    # Set as run's parent and workflow relationship
+    # Set as run's parent and workflow relationship.
+    # add_relationship only updates metadata in memory, save persists both at once
     run.add_relationship(Relationship.STEP_OF.value, workflow_run_key)
     run.add_relationship(Relationship.RUN_OF.value, func.key)
     run.save()
 
     # Wait for completion with retries
-    _wait_for_run(run)
+    run = _wait_for_run(run)
 
     # Check for errors
     if run.status.state == State.ERROR.value:
@@ -238,8 +325,9 @@ def main() -> None:
     )
 
     args = parser.parse_args()
-    exec_entity = _parse_exec_entity(args.entity)
     exec_kwargs = json.loads(args.kwargs)
+    _check_step_requirements(exec_kwargs)
+    exec_entity = _parse_exec_entity(args.entity)
     execute_step(exec_entity, exec_kwargs)
 
 